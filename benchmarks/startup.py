@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+# benchmarks/startup.py
+
+"""Замер времени запуска базы данных.
+
+Каждый прогон выполняется в новом процессе интерпретатора:
+
+- ``import`` — только импорт ``src.primitive_db.main``;
+- ``exit`` — полный запуск с командой ``exit`` на stdin.
+
+Запуск: ``make bench-startup`` или ``python benchmarks/startup.py --runs 20``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "import": ([sys.executable, "-c", "import src.primitive_db.main"], ""),
+    "exit": ([sys.executable, "-m", "src.primitive_db.main"], "exit\n"),
+}
+
+
+def measure(command: list[str], stdin: str, runs: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command,
+            cwd=ROOT,
+            input=stdin,
+            text=True,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = measure([sys.executable, "-c", "pass"], "", args.runs)
+    print(f"{'сценарий':<10} {'мин, мс':>10} {'медиана, мс':>12}")
+    print(f"{'python':<10} {min(baseline):>10.1f} {statistics.median(baseline):>12.1f}")
+
+    for name, (command, stdin) in SCENARIOS.items():
+        timings = measure(command, stdin, args.runs)
+        print(
+            f"{name:<10} {min(timings):>10.1f} "
+            f"{statistics.median(timings):>12.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
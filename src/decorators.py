@@ -28,7 +28,7 @@ def handle_db_errors(func: F) -> F:
     return cast(F, wrapper)
 
 
-def confirm_action(action_name: str) -> Callable[[F], F]:
+def confirm_action(action_name: str, state_arg: int = 0) -> Callable[[F], F]:
 
     def decorator(func: F) -> F:
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -37,9 +37,9 @@ def confirm_action(action_name: str) -> Callable[[F], F]:
             ).strip().lower()
             if answer != "y":
                 print("Операция отменена пользователем.")
-                # Возвращаем первый аргумент (метаданные или данные),
+                # Возвращаем аргумент с состоянием (метаданные или данные),
                 # чтобы состояние не менялось.
-                return args[0] if args else None
+                return args[state_arg] if len(args) > state_arg else None
             return func(*args, **kwargs)
 
         return cast(F, wrapper)
@@ -0,0 +1,39 @@
+# src/primitive_db/catalog.py
+
+"""Скомпилированное представление схемы таблиц.
+
+Для каждой таблицы один раз строятся список имён, словарь типов и список
+столбцов данных. Запись пересобирается, только когда в метаданных появляется новый
+список столбцов, то есть после изменения ``db_meta.json``.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+_compiled: Dict[str, Tuple[List[Dict[str, str]], Dict[str, Any]]] = {}
+
+
+def _compile_table(columns: List[Dict[str, str]]) -> Dict[str, Any]:
+    names = [column["name"] for column in columns]
+    return {
+        "names": names,
+        "types": {column["name"]: column["type"] for column in columns},
+        "data_columns": [column for column in columns if column["name"] != "ID"],
+    }
+
+
+def get_table_catalog(
+    metadata: Dict[str, Any],
+    table_name: str,
+) -> Dict[str, Any] | None:
+    table_meta = metadata.get(table_name)
+    if not table_meta:
+        return None
+
+    columns = table_meta.get("columns", [])
+    cached = _compiled.get(table_name)
+    if cached is not None and cached[0] is columns:
+        return cached[1]
+
+    compiled = _compile_table(columns)
+    _compiled[table_name] = (columns, compiled)
+    return compiled
@@ -4,3 +4,9 @@ META_FILE = "db_meta.json"
 DATA_DIR = "data"
 VALID_TYPES = {"int", "str", "bool"}
 
+
+DURABILITY_MODES = {"sync", "interval", "on-exit"}
+DURABILITY_ENV = "PRIMITIVE_DB_DURABILITY"
+FLUSH_INTERVAL_ENV = "PRIMITIVE_DB_FLUSH_INTERVAL"
+DEFAULT_DURABILITY = "sync"
+DEFAULT_FLUSH_INTERVAL = 1.0
@@ -11,6 +11,8 @@ from src.decorators import (
 )
 
 from .constants import VALID_TYPES
+from .parser import ColumnExpression
+from .storage import MappedTable
 
 _select_cache = create_cacher()
 
@@ -111,6 +113,7 @@ def select(
     table_name: str,
     table_data: List[Dict[str, Any]],
     where_clause: Dict[str, Any] | None = None,
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     key: Any = (table_name, None)
     if where_clause is not None:
@@ -123,9 +126,26 @@ def select(
         column, value = next(iter(where_clause.items()))
         return [row for row in table_data if row.get(column) == value]
 
+    if not use_cache:
+        return compute()
     return _select_cache(key, compute)
 
 
+@log_time
+@handle_db_errors
+def select_mapped(
+    table: MappedTable,
+    where_clause: Dict[str, Any] | None = None,
+    columns: List[str] | None = None,
+) -> List[Dict[str, Any]]:
+    if where_clause is None:
+        offsets = list(table.offsets())
+    else:
+        column, value = next(iter(where_clause.items()))
+        offsets = table.find(column, value)
+    return [table.read_row(offset, columns) for offset in offsets]
+
+
 @handle_db_errors
 def update(
     table_name: str,
@@ -133,26 +153,48 @@ def update(
     set_clause: Dict[str, Any],
     where_clause: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
-    set_column, set_value = next(iter(set_clause.items()))
     where_column, where_value = next(iter(where_clause.items()))
+    matched = [row for row in table_data if row.get(where_column) == where_value]
+
+    literals = {
+        column: value
+        for column, value in set_clause.items()
+        if not isinstance(value, ColumnExpression)
+    }
+    expressions = {
+        column: value
+        for column, value in set_clause.items()
+        if isinstance(value, ColumnExpression)
+    }
+
+    # Выражения вычисляются по значениям строк до обновления и целиком
+    # до первой записи, чтобы ошибка не оставила таблицу изменённой частично.
+    computed: List[Dict[str, Any]] = []
+    for row in matched:
+        values: Dict[str, Any] = {}
+        for column, expression in expressions.items():
+            try:
+                values[column] = expression.evaluate(row)
+            except TypeError as error:
+                raise ValueError(
+                    f"не удалось вычислить {column} для записи "
+                    f"с ID={row.get('ID')}: {error}",
+                ) from error
+        computed.append(values)
+
+    for row, values in zip(matched, computed, strict=True):
+        row.update(literals)
+        row.update(values)
 
-    updated_ids: List[int] = []
-
-    for row in table_data:
-        if row.get(where_column) == where_value:
-            row[set_column] = set_value
-            if "ID" in row:
-                updated_ids.append(row["ID"])
-
-    for row_id in updated_ids:
-        print(
-            f'Запись с ID={row_id} в таблице "{table_name}" успешно обновлена.',
-        )
+    print(
+        f'Обновлено записей в таблице "{table_name}": {len(matched)} '
+        f'(столбцы: {", ".join(set_clause)}).',
+    )
 
     return table_data
 
 
-@confirm_action("удаление записей")
+@confirm_action("удаление записей", state_arg=1)
 @handle_db_errors
 def delete(
     table_name: str,
@@ -183,7 +225,7 @@ def delete(
 def info_table(
     metadata: Dict[str, Any],
     table_name: str,
-    table_data: List[Dict[str, Any]],
+    table_data: List[Dict[str, Any]] | MappedTable,
 ) -> None:
     if table_name not in metadata:
         raise KeyError(table_name)
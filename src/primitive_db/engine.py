@@ -4,8 +4,8 @@
 import shlex
 
 import prompt
-from prettytable import PrettyTable
 
+from .catalog import get_table_catalog
 from .constants import META_FILE
 from .core import (
     create_table,
@@ -15,15 +15,18 @@ from .core import (
     insert,
     list_tables,
     select,
+    select_mapped,
     update,
 )
-from .parser import parse_condition, parse_values
+from .parser import parse_condition, parse_set_clause, parse_values
 from .utils import (
+    load_mapped_table,
     load_metadata,
     load_table_data,
+    remove_mapped_table,
     save_metadata,
-    save_table_data,
 )
+from .writer import TableWriter, create_writer
 
 
 def print_help() -> None:
@@ -42,27 +45,33 @@ def print_help() -> None:
         "- прочитать все записи.",
     )
     print(
-        "<command> update <имя_таблицы> set <столбец1> = <новое_значение1> "
-        "where <столбец_условия> = <значение_условия> - обновить запись.",
+        "<command> update <имя_таблицы> set <столбец1> = <новое_значение1>"
+        "[, <столбец2> = <столбец2> + <число>, ...] "
+        "where <столбец_условия> = <значение_условия> - обновить записи.",
     )
     print(
         "<command> delete from <имя_таблицы> where <столбец> = <значение> "
         "- удалить запись.",
     )
     print("<command> info <имя_таблицы> - вывести информацию о таблице.")
+    print(
+        "<command> flush - записать отложенные изменения на диск "
+        "(см. PRIMITIVE_DB_DURABILITY).",
+    )
     print("<command> exit - выход из программы")
     print("<command> help- справочная информация\n")
 
 
 def _print_select_result(metadata: dict, table_name: str, rows: list[dict]) -> None:
     """Вывести результат select с помощью PrettyTable."""
-    table_meta = metadata.get(table_name)
-    if not table_meta:
+    from prettytable import PrettyTable
+
+    table_catalog = get_table_catalog(metadata, table_name)
+    if table_catalog is None:
         print(f'Ошибка: Таблица "{table_name}" не существует.')
         return
 
-    columns_meta = table_meta.get("columns", [])
-    field_names = [col["name"] for col in columns_meta]
+    field_names = table_catalog["names"]
 
     pretty = PrettyTable()
     pretty.field_names = field_names
@@ -73,9 +82,25 @@ def _print_select_result(metadata: dict, table_name: str, rows: list[dict]) -> N
     print(pretty)
 
 
+def _load_table(writer: TableWriter, table_name: str) -> list[dict]:
+    """Прочитать таблицу с учётом ещё не записанных изменений."""
+    pending = writer.pending(table_name)
+    if pending is not None:
+        return pending
+    return load_table_data(table_name)
+
+
 def run() -> None:
     print_help()
 
+    writer = create_writer()
+    try:
+        _command_loop(writer)
+    finally:
+        writer.close()
+
+
+def _command_loop(writer: TableWriter) -> None:
     while True:
         user_input = prompt.string("Введите команду: ")
 
@@ -99,6 +124,11 @@ def run() -> None:
             print_help()
             continue
 
+        if command == "flush":
+            written = writer.flush()
+            print(f"Записано таблиц на диск: {written}.")
+            continue
+
         # ----- управление таблицами -----
         if command == "create_table":
             if len(args) < 3:
@@ -129,6 +159,9 @@ def run() -> None:
             table_name = args[1]
             metadata = drop_table(metadata, table_name)
             save_metadata(META_FILE, metadata)
+            if isinstance(metadata, dict) and table_name not in metadata:
+                writer.discard(table_name)
+                remove_mapped_table(table_name)
             continue
 
         # ----- insert into <table> values (...) -----
@@ -159,9 +192,15 @@ def run() -> None:
             if values is None:
                 continue
 
-            table_data = load_table_data(table_name)
+            table_data = _load_table(writer, table_name)
             table_data = insert(metadata, table_name, values, table_data)
-            save_table_data(table_name, table_data)
+            if not isinstance(table_data, list):
+                continue
+            writer.submit(
+                table_name,
+                table_data,
+                metadata[table_name]["columns"],
+            )
             continue
 
         # ----- select from <table> [where ...] -----
@@ -178,13 +217,10 @@ def run() -> None:
                 print(f'Ошибка: Таблица "{table_name}" не существует.')
                 continue
 
-            table_data = load_table_data(table_name)
-
             lower_input = user_input.lower()
             where_pos = lower_input.find("where")
-            if where_pos == -1:
-                rows = select(table_name, table_data)
-            else:
+            where_clause = None
+            if where_pos != -1:
                 condition_str = user_input[where_pos + len("where") :].strip()
                 where_clause = parse_condition(
                     metadata,
@@ -193,7 +229,33 @@ def run() -> None:
                 )
                 if where_clause is None:
                     continue
-                rows = select(table_name, table_data, where_clause)
+
+            field_names = get_table_catalog(metadata, table_name)["names"]
+            table_data = writer.pending(table_name)
+            mapped = None
+            if table_data is None:
+                mapped = load_mapped_table(
+                    table_name,
+                    metadata[table_name]["columns"],
+                )
+            if mapped is not None:
+                with mapped:
+                    rows = select_mapped(mapped, where_clause, field_names)
+            else:
+                if table_data is None:
+                    rows = select(
+                        table_name,
+                        load_table_data(table_name),
+                        where_clause,
+                    )
+                else:
+                    # Кэш select не знает об отложенных изменениях.
+                    rows = select(
+                        table_name,
+                        table_data,
+                        where_clause,
+                        use_cache=False,
+                    )
 
             _print_select_result(metadata, table_name, rows)
             continue
@@ -226,7 +288,7 @@ def run() -> None:
             set_str = user_input[set_pos + len("set") : where_pos].strip()
             where_str = user_input[where_pos + len("where") :].strip()
 
-            set_clause = parse_condition(metadata, table_name, set_str)
+            set_clause = parse_set_clause(metadata, table_name, set_str)
             if set_clause is None:
                 continue
 
@@ -234,9 +296,15 @@ def run() -> None:
             if where_clause is None:
                 continue
 
-            table_data = load_table_data(table_name)
+            table_data = _load_table(writer, table_name)
             table_data = update(table_name, table_data, set_clause, where_clause)
-            save_table_data(table_name, table_data)
+            if not isinstance(table_data, list):
+                continue
+            writer.submit(
+                table_name,
+                table_data,
+                metadata[table_name]["columns"],
+            )
             continue
 
         # ----- delete from <table> where ... -----
@@ -267,9 +335,15 @@ def run() -> None:
             if where_clause is None:
                 continue
 
-            table_data = load_table_data(table_name)
+            table_data = _load_table(writer, table_name)
             table_data = delete(table_name, table_data, where_clause)
-            save_table_data(table_name, table_data)
+            if not isinstance(table_data, list):
+                continue
+            writer.submit(
+                table_name,
+                table_data,
+                metadata[table_name]["columns"],
+            )
             continue
 
         # ----- info <table> -----
@@ -282,8 +356,22 @@ def run() -> None:
                 continue
 
             table_name = args[1]
-            table_data = load_table_data(table_name)
-            info_table(metadata, table_name, table_data)
+            table_data = writer.pending(table_name)
+            mapped = None
+            if table_data is None:
+                # info не требует существования таблицы: ошибку выводит core.
+                table_meta = metadata.get(table_name, {})
+                mapped = load_mapped_table(
+                    table_name,
+                    table_meta.get("columns", []),
+                )
+            if mapped is not None:
+                with mapped:
+                    info_table(metadata, table_name, mapped)
+            else:
+                if table_data is None:
+                    table_data = load_table_data(table_name)
+                info_table(metadata, table_name, table_data)
             continue
 
         # ----- неизвестная команда -----
@@ -1,7 +1,27 @@
 # src/primitive_db/parser.py
 
 
-from typing import Any, Dict, List
+import operator
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from .catalog import get_table_catalog
+
+SET_OPERATORS: Dict[str, Dict[str, Callable[[Any, Any], Any]]] = {
+    "int": {"+": operator.add, "-": operator.sub, "*": operator.mul},
+    "str": {"+": operator.add},
+}
+
+
+class ColumnExpression(NamedTuple):
+    column: str
+    function: Callable[[Any, Any], Any]
+    operand: Any = None
+    operand_column: str | None = None
+
+    def evaluate(self, row: Dict[str, Any]) -> Any:
+        if self.operand_column is not None:
+            return self.function(row.get(self.column), row.get(self.operand_column))
+        return self.function(row.get(self.column), self.operand)
 
 
 def get_column_type(
@@ -9,33 +29,41 @@ def get_column_type(
     table_name: str,
     column_name: str,
 ) -> str | None:
-    table_meta = metadata.get(table_name)
-    if not table_meta:
+    table_catalog = get_table_catalog(metadata, table_name)
+    if table_catalog is None:
         return None
+    return table_catalog["types"].get(column_name)
 
-    for column in table_meta.get("columns", []):
-        if column["name"] == column_name:
-            return column["type"]
-    return None
+
+def _convert_bool(raw_value: str) -> bool:
+    lower = raw_value.lower()
+    if lower == "true":
+        return True
+    if lower == "false":
+        return False
+    raise ValueError
+
+
+def _convert_str(raw_value: str) -> str:
+    if raw_value.startswith('"') and raw_value.endswith('"'):
+        return raw_value[1:-1]
+    if raw_value.startswith("'") and raw_value.endswith("'"):
+        return raw_value[1:-1]
+    return raw_value
+
+
+CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "bool": _convert_bool,
+    "str": _convert_str,
+}
 
 
 def convert_value(raw_value: str, type_name: str) -> Any:
-    if type_name == "int":
-        return int(raw_value)
-    if type_name == "bool":
-        lower = raw_value.lower()
-        if lower == "true":
-            return True
-        if lower == "false":
-            return False
-        raise ValueError
-    if type_name == "str":
-        if raw_value.startswith('"') and raw_value.endswith('"'):
-            return raw_value[1:-1]
-        if raw_value.startswith("'") and raw_value.endswith("'"):
-            return raw_value[1:-1]
+    converter = CONVERTERS.get(type_name)
+    if converter is None:
         return raw_value
-    return raw_value
+    return converter(raw_value)
 
 
 def parse_values(
@@ -55,13 +83,12 @@ def parse_values(
 
     raw_items = [item.strip() for item in inner.split(",")]
 
-    table_meta = metadata.get(table_name)
-    if not table_meta:
+    table_catalog = get_table_catalog(metadata, table_name)
+    if table_catalog is None:
         print(f'Ошибка: Таблица "{table_name}" не существует.')
         return None
 
-    columns_meta = table_meta.get("columns", [])
-    data_columns = [col for col in columns_meta if col["name"] != "ID"]
+    data_columns = table_catalog["data_columns"]
 
     if len(raw_items) != len(data_columns):
         print(f"Некорректное значение: {values_part}. Попробуйте снова.")
@@ -107,3 +134,94 @@ def parse_condition(
 
     return {column_name: value}
 
+
+
+def _split_assignments(set_str: str) -> List[str]:
+    parts: List[str] = []
+    current: List[str] = []
+    quote: str | None = None
+    for char in set_str:
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == ",":
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return parts
+
+
+def _parse_expression(
+    metadata: Dict[str, Any],
+    table_name: str,
+    type_name: str,
+    raw_value: str,
+) -> ColumnExpression | None:
+    for symbol, function in SET_OPERATORS.get(type_name, {}).items():
+        left, separator, right = raw_value.partition(symbol)
+        source_column = left.strip()
+        if not separator or not source_column or not right.strip():
+            continue
+        if get_column_type(metadata, table_name, source_column) != type_name:
+            continue
+
+        raw_operand = right.strip()
+        operand_type = get_column_type(metadata, table_name, raw_operand)
+        if operand_type is not None:
+            if operand_type != type_name:
+                raise ValueError
+            return ColumnExpression(
+                source_column,
+                function,
+                operand_column=raw_operand,
+            )
+        return ColumnExpression(
+            source_column,
+            function,
+            convert_value(raw_operand, type_name),
+        )
+    return None
+
+
+def parse_set_clause(
+    metadata: Dict[str, Any],
+    table_name: str,
+    set_str: str,
+) -> Dict[str, Any] | None:
+    result: Dict[str, Any] = {}
+
+    for assignment in _split_assignments(set_str):
+        if "=" not in assignment:
+            print(f"Некорректное значение: {assignment}. Попробуйте снова.")
+            return None
+
+        left, right = assignment.split("=", 1)
+        column_name = left.strip()
+        raw_value = right.strip()
+
+        type_name = get_column_type(metadata, table_name, column_name)
+        if type_name is None or column_name in result:
+            print(f"Некорректное значение: {column_name}. Попробуйте снова.")
+            return None
+
+        try:
+            expression = _parse_expression(
+                metadata,
+                table_name,
+                type_name,
+                raw_value,
+            )
+            result[column_name] = (
+                expression
+                if expression is not None
+                else convert_value(raw_value, type_name)
+            )
+        except (ValueError, TypeError):
+            print(f"Некорректное значение: {raw_value}. Попробуйте снова.")
+            return None
+
+    return result
@@ -0,0 +1,235 @@
+# src/primitive_db/storage.py
+
+"""Фиксированный бинарный формат таблиц и чтение через mmap.
+
+Файл ``data/<таблица>.tbl`` состоит из заголовка и записей одинаковой длины:
+
+    b"PDBT" | uint32 длина заголовка | JSON-заголовок | строки...
+
+Каждое поле строки занимает постоянное число байт (int — 8, bool — 1,
+str — ширина самого длинного значения в UTF-8, дополненная нулями), поэтому
+смещение любой строки и столбца вычисляется без разбора файла. Несколько
+процессов, открывших один файл, используют общий страничный кэш ОС.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterator, List
+
+MAGIC = b"PDBT"
+_HEADER_LEN = struct.Struct("<I")
+_FIELD_FORMATS = {"int": "q", "bool": "?"}
+
+
+def _field_format(column: Dict[str, Any]) -> str:
+    if column["type"] == "str":
+        return f"{column['width']}s"
+    return _FIELD_FORMATS[column["type"]]
+
+
+def _encode_field(column: Dict[str, Any], value: Any) -> Any:
+    """Проверить значение по типу столбца и подготовить его для struct.
+
+    ``None``, отсутствующие значения и значения другого типа не имеют
+    представления в формате: вызывается TypeError, и таблица читается из JSON.
+    """
+    type_name = column["type"]
+    if type_name == "str" and isinstance(value, str) and "\0" not in value:
+        return value.encode("utf-8")
+    if type_name == "bool" and isinstance(value, bool):
+        return value
+    if type_name == "int" and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise TypeError(
+        f'Значение {value!r} не подходит для столбца {column["name"]}:{type_name}',
+    )
+
+
+def encode_table(
+    columns_meta: List[Dict[str, str]],
+    data: List[Dict[str, Any]],
+) -> bytes:
+    columns: List[Dict[str, Any]] = []
+    offset = 0
+    for column_meta in columns_meta:
+        column: Dict[str, Any] = dict(column_meta)
+        if column["type"] == "str":
+            column["width"] = max(
+                (
+                    len(_encode_field(column, row.get(column["name"])))
+                    for row in data
+                ),
+                default=0,
+            )
+        column["offset"] = offset
+        offset += struct.calcsize("<" + _field_format(column))
+        columns.append(column)
+
+    row_struct = struct.Struct("<" + "".join(_field_format(c) for c in columns))
+    id_values = [row.get("ID") for row in data]
+    header = {
+        "columns": columns,
+        "rows": len(data),
+        "row_size": row_struct.size,
+        "id_sorted": all(isinstance(value, int) for value in id_values)
+        and all(a < b for a, b in zip(id_values, id_values[1:])),
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+    parts = [MAGIC, _HEADER_LEN.pack(len(header_bytes)), header_bytes]
+    for row in data:
+        parts.append(
+            row_struct.pack(
+                *(_encode_field(c, row.get(c["name"])) for c in columns),
+            ),
+        )
+    return b"".join(parts)
+
+
+def write_table_file(
+    path: str,
+    columns_meta: List[Dict[str, str]],
+    data: List[Dict[str, Any]],
+) -> None:
+    """Записать таблицу в фиксированном формате.
+
+    Если данные не помещаются в формат (пропущенные значения, другой тип,
+    int вне 64 бит), файл удаляется, чтобы читатели вернулись к JSON.
+    """
+    try:
+        payload = encode_table(columns_meta, data)
+    except (struct.error, AttributeError, KeyError, TypeError):
+        if os.path.exists(path):
+            os.remove(path)
+        return
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(payload)
+    os.replace(tmp_path, path)
+
+
+class MappedTable:
+    """Таблица, отображённая в память только для чтения.
+
+    Строки декодируются лениво: условия сравниваются с байтами в буфере,
+    а в словари превращаются только выбранные строки.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._buffer[: len(MAGIC)] != MAGIC:
+            self._buffer.close()
+            raise ValueError(f"Некорректный формат файла таблицы: {path}")
+
+        (header_len,) = _HEADER_LEN.unpack_from(self._buffer, len(MAGIC))
+        header_start = len(MAGIC) + _HEADER_LEN.size
+        header = json.loads(
+            self._buffer[header_start : header_start + header_len],
+        )
+
+        self.columns: List[Dict[str, Any]] = header["columns"]
+        self.rows: int = header["rows"]
+        self.row_size: int = header["row_size"]
+        self.id_sorted: bool = header["id_sorted"]
+        self.data_start = header_start + header_len
+        self._by_name = {column["name"]: column for column in self.columns}
+        self._field_structs = {
+            column["name"]: struct.Struct("<" + _field_format(column))
+            for column in self.columns
+        }
+
+    def __enter__(self) -> "MappedTable":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def offsets(self) -> Iterator[int]:
+        return iter(
+            range(
+                self.data_start,
+                self.data_start + self.rows * self.row_size,
+                self.row_size,
+            ),
+        )
+
+    def read_value(self, offset: int, column_name: str) -> Any:
+        column = self._by_name[column_name]
+        (value,) = self._field_structs[column_name].unpack_from(
+            self._buffer,
+            offset + column["offset"],
+        )
+        if column["type"] == "str":
+            return value.rstrip(b"\0").decode("utf-8")
+        return value
+
+    def read_row(
+        self,
+        offset: int,
+        columns: List[str] | None = None,
+    ) -> Dict[str, Any]:
+        names = columns if columns is not None else list(self._by_name)
+        return {name: self.read_value(offset, name) for name in names}
+
+    def _encode_key(self, column_name: str, value: Any) -> bytes | None:
+        column = self._by_name[column_name]
+        try:
+            encoded = _encode_field(column, value)
+        except TypeError:
+            return None
+        if column["type"] == "str":
+            if len(encoded) > column["width"]:
+                return None
+            return encoded.ljust(column["width"], b"\0")
+        try:
+            return self._field_structs[column_name].pack(encoded)
+        except struct.error:
+            return None
+
+    def _find_sorted_id(self, value: int) -> List[int]:
+        low, high = 0, self.rows
+        while low < high:
+            middle = (low + high) // 2
+            offset = self.data_start + middle * self.row_size
+            current = self.read_value(offset, "ID")
+            if current < value:
+                low = middle + 1
+            else:
+                high = middle
+        offset = self.data_start + low * self.row_size
+        if low < self.rows and self.read_value(offset, "ID") == value:
+            return [offset]
+        return []
+
+    def find(self, column_name: str, value: Any) -> List[int]:
+        """Вернуть смещения строк, у которых ``column_name == value``."""
+        if column_name not in self._by_name:
+            return []
+
+        column = self._by_name[column_name]
+        if column_name == "ID" and self.id_sorted and isinstance(value, int):
+            return self._find_sorted_id(value)
+
+        key = self._encode_key(column_name, value)
+        if key is None:
+            return []
+
+        start = column["offset"]
+        end = start + len(key)
+        buffer = self._buffer
+        return [
+            offset
+            for offset in self.offsets()
+            if buffer[offset + start : offset + end] == key
+        ]
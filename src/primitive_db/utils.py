@@ -3,28 +3,51 @@
 
 import json
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .constants import DATA_DIR
+from .storage import MappedTable, write_table_file
+
+_metadata_cache: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+_unmappable: Dict[str, Tuple[Tuple[int, int, int], List[Tuple[str, str]]]] = {}
+
+
+def _file_signature(filepath: str) -> Tuple[int, int, int]:
+    stat = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
 
 
 def load_metadata(filepath: str) -> Dict[str, Any]:
+    """Прочитать метаданные; файл разбирается заново только после изменения."""
     try:
-        with open(filepath, "r", encoding="utf-8") as file:
-            return json.load(file)
+        signature = _file_signature(filepath)
     except FileNotFoundError:
         return {}
 
+    cached = _metadata_cache.get(filepath)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(filepath, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    _metadata_cache[filepath] = (signature, data)
+    return data
+
 
 def save_metadata(filepath: str, data: Dict[str, Any]) -> None:
     with open(filepath, "w", encoding="utf-8") as file:
         json.dump(data, file, ensure_ascii=False, indent=2)
+    _metadata_cache[filepath] = (_file_signature(filepath), data)
 
 
 def _get_table_path(table_name: str) -> str:
     return os.path.join(DATA_DIR, f"{table_name}.json")
 
 
+def _get_mapped_path(table_name: str) -> str:
+    return os.path.join(DATA_DIR, f"{table_name}.tbl")
+
+
 def load_table_data(table_name: str) -> List[Dict[str, Any]]:
     path = _get_table_path(table_name)
     try:
@@ -34,9 +57,89 @@ def load_table_data(table_name: str) -> List[Dict[str, Any]]:
         return []
 
 
-def save_table_data(table_name: str, data: List[Dict[str, Any]]) -> None:
+def save_table_data(
+    table_name: str,
+    data: List[Dict[str, Any]],
+    columns_meta: List[Dict[str, str]] | None = None,
+) -> None:
+    """Записать таблицу в JSON.
+
+    С ``columns_meta`` сразу пересобирается и .tbl-файл (так делает фоновый
+    writer при сбросе); без него .tbl удаляется и будет собран при первом
+    чтении через mmap.
+    """
     os.makedirs(DATA_DIR, exist_ok=True)
     path = _get_table_path(table_name)
     with open(path, "w", encoding="utf-8") as file:
         json.dump(data, file, ensure_ascii=False, indent=2)
 
+    if columns_meta is not None:
+        write_table_file(_get_mapped_path(table_name), columns_meta, data)
+    else:
+        remove_mapped_table(table_name)
+
+
+def remove_mapped_table(table_name: str) -> None:
+    mapped_path = _get_mapped_path(table_name)
+    if os.path.exists(mapped_path):
+        os.remove(mapped_path)
+
+
+def _open_mapped(
+    mapped_path: str,
+    expected: List[Tuple[str, str]],
+) -> MappedTable | None:
+    try:
+        mapped = MappedTable(mapped_path)
+    except (OSError, ValueError):
+        return None
+
+    actual = [(col["name"], col["type"]) for col in mapped.columns]
+    if actual != expected:
+        mapped.close()
+        return None
+    return mapped
+
+
+def load_mapped_table(
+    table_name: str,
+    columns_meta: List[Dict[str, str]],
+) -> MappedTable | None:
+    """Открыть .tbl-файл таблицы, при необходимости собрав его из JSON.
+
+    Файл пересобирается, если он старше JSON или его схема отличается от
+    ``columns_meta``. Если данные не кодируются в формат, это запоминается
+    до следующего изменения JSON, и вызывающий читает JSON.
+    """
+    table_path = _get_table_path(table_name)
+    mapped_path = _get_mapped_path(table_name)
+    try:
+        json_signature = _file_signature(table_path)
+    except FileNotFoundError:
+        return None
+
+    expected = [(col["name"], col["type"]) for col in columns_meta]
+    try:
+        fresh = os.stat(mapped_path).st_mtime_ns >= json_signature[0]
+    except FileNotFoundError:
+        fresh = False
+
+    if fresh:
+        mapped = _open_mapped(mapped_path, expected)
+        if mapped is not None:
+            return mapped
+
+    build_key = (json_signature, expected)
+    if _unmappable.get(table_name) == build_key:
+        return None
+
+    write_table_file(mapped_path, columns_meta, load_table_data(table_name))
+    if _file_signature(table_path) != json_signature:
+        # JSON изменился во время сборки — собранная копия уже устарела.
+        remove_mapped_table(table_name)
+        return None
+
+    mapped = _open_mapped(mapped_path, expected)
+    if mapped is None:
+        _unmappable[table_name] = build_key
+    return mapped
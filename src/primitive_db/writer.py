@@ -0,0 +1,138 @@
+# src/primitive_db/writer.py
+
+"""Отложенная запись таблиц на диск.
+
+Режимы надёжности:
+
+- ``sync`` — таблица записывается сразу, как и раньше;
+- ``interval`` — фоновый поток сбрасывает изменения раз в ``interval`` секунд;
+- ``on-exit`` — изменения копятся до ``flush`` или ``exit``.
+
+Несколько изменений одной таблицы между сбросами объединяются в одну запись
+последнего снимка.
+"""
+
+import math
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+from .constants import (
+    DEFAULT_DURABILITY,
+    DEFAULT_FLUSH_INTERVAL,
+    DURABILITY_ENV,
+    DURABILITY_MODES,
+    FLUSH_INTERVAL_ENV,
+)
+from .utils import save_table_data
+
+_Snapshot = Tuple[List[Dict[str, Any]], List[Dict[str, str]] | None]
+
+
+class TableWriter:
+    def __init__(
+        self,
+        mode: str = DEFAULT_DURABILITY,
+        interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        if mode not in DURABILITY_MODES:
+            raise ValueError(f"Некорректный режим записи: {mode}")
+        if not math.isfinite(interval) or interval <= 0:
+            raise ValueError(f"Некорректный интервал записи: {interval}")
+
+        self.mode = mode
+        self.interval = interval
+        self._pending: Dict[str, _Snapshot] = {}
+        self._in_flight: Dict[str, _Snapshot] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        if mode == "interval":
+            self._thread = threading.Thread(
+                target=self._run,
+                name="primitive-db-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as error:  # noqa: BLE001
+                print(f"Ошибка фоновой записи: {error}")
+
+    def submit(
+        self,
+        table_name: str,
+        data: List[Dict[str, Any]],
+        columns_meta: List[Dict[str, str]] | None = None,
+    ) -> None:
+        if self.mode == "sync":
+            # .tbl соберётся при первом чтении, а не на каждую команду.
+            save_table_data(table_name, data)
+            return
+
+        # data — собственная копия вызывающего (см. pending), её не меняют
+        # после передачи, поэтому повторно не копируем.
+        with self._lock:
+            self._pending[table_name] = (data, columns_meta)
+
+    def pending(self, table_name: str) -> List[Dict[str, Any]] | None:
+        """Вернуть копию ещё не записанных данных таблицы, если они есть."""
+        with self._lock:
+            entry = self._pending.get(table_name) or self._in_flight.get(
+                table_name,
+            )
+            if entry is None:
+                return None
+            return [dict(row) for row in entry[0]]
+
+    def discard(self, table_name: str) -> None:
+        """Забыть незаписанные изменения таблицы (например, после drop_table)."""
+        # _flush_lock дожидается записи, которая уже могла взять таблицу.
+        with self._flush_lock, self._lock:
+            self._pending.pop(table_name, None)
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                self._in_flight = self._pending
+                self._pending = {}
+
+            written = 0
+            try:
+                for table_name, (data, columns_meta) in self._in_flight.items():
+                    try:
+                        save_table_data(table_name, data, columns_meta)
+                        written += 1
+                    except Exception as error:  # noqa: BLE001
+                        print(f'Ошибка записи таблицы "{table_name}": {error}')
+                        with self._lock:
+                            self._pending.setdefault(
+                                table_name,
+                                (data, columns_meta),
+                            )
+            finally:
+                with self._lock:
+                    self._in_flight = {}
+            return written
+
+    def close(self) -> int:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.flush()
+
+
+def create_writer() -> TableWriter:
+    mode = os.environ.get(DURABILITY_ENV, DEFAULT_DURABILITY)
+    raw_interval = os.environ.get(FLUSH_INTERVAL_ENV)
+    try:
+        interval = float(raw_interval) if raw_interval else DEFAULT_FLUSH_INTERVAL
+        return TableWriter(mode, interval)
+    except ValueError as error:
+        print(f"{error}. Используется режим {DEFAULT_DURABILITY}.")
+        return TableWriter()